@@ -1,10 +1,20 @@
+import os
+
 import dash
+import flask
+import numpy as np
 import pandas as pd
 from dash import dcc, html
 from dash import dash_table
+from dash import Input, Output, State
 import plotly.express as px
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from plotly.io.json import to_json_plotly
 from pydantic import BaseModel
 import dash_bootstrap_components as dbc
+from waitress import serve
 
 
 class InvestmentData(BaseModel):
@@ -15,56 +25,128 @@ class InvestmentData(BaseModel):
     Total_Dividends: float
 
 
+class StaticLayoutDash(dash.Dash):
+    # The dashboard layout never changes after startup, so serialize it once
+    # instead of re-encoding every table and figure on each page load
+    _layout_json = None
+
+    def serve_layout(self):
+        if self._layout_json is None:
+            self._layout_json = to_json_plotly(self._layout_value())
+        return flask.Response(self._layout_json, mimetype="application/json")
+
+
+# Statement export and the cleaned summary cached next to it
+CSV_PATH = "robinhood_statement.csv"
+CACHE_PATH = "robinhood_statement.cache.parquet"
+CACHE_KEY_PATH = "robinhood_statement.cache.key"
+
+# Bump whenever process_data() changes how the summary is computed or its
+# columns, so caches written by older code are rebuilt
+CACHE_VERSION = 1
+
+# Statement columns the summary is built from
+CSV_COLUMNS = ["Instrument", "Trans Code", "Quantity", "Price", "Amount"]
+
+# Transaction codes the summary is built from
+TRANS_CODES = pd.CategoricalDtype(["Buy", "Sell", "CDIV"])
+
+# Characters stripped from currency strings such as "($1,234.56)"
+_CURRENCY_TABLE = str.maketrans("", "", "$,()")
+
+
+def _load_cached_summary(key):
+    # Reuse the cached summary only if it was built from the same CSV, and
+    # treat an unreadable or truncated cache as a miss
+    try:
+        with open(CACHE_KEY_PATH, encoding="utf-8") as f:
+            if f.read() != key:
+                return None
+        return pd.read_parquet(CACHE_PATH)
+    except (OSError, pa.ArrowException):
+        return None
+
+
+def _save_cached_summary(summary, key):
+    # Caching is best effort, the summary is still returned if it fails
+    try:
+        if os.path.exists(CACHE_KEY_PATH):
+            os.remove(CACHE_KEY_PATH)
+        summary.to_parquet(CACHE_PATH, compression="zstd")
+        with open(CACHE_KEY_PATH, "w", encoding="utf-8") as f:
+            f.write(key)
+    except (OSError, pa.ArrowException):
+        pass
+
+
+def _parse_currency(series):
+    # Amounts shown in parentheses are negative
+    negative = series.str.startswith("(", na=False)
+    values = pd.to_numeric(series.str.translate(_CURRENCY_TABLE), errors="coerce")
+    return values.mask(negative, -values)
+
+
 # Function to process data
 def process_data():
-    # Load the data (update the path to your actual file path)
-    df = pd.read_csv("robinhood_statement.csv", encoding="utf-8", on_bad_lines="skip")
+    # Skip the CSV parsing entirely when the statement has not changed
+    key = f"{CACHE_VERSION}:{os.path.getmtime(CSV_PATH)}:{os.path.getsize(CSV_PATH)}"
+    cached = _load_cached_summary(key)
+    if cached is not None:
+        return cached
 
-    # Filter the transactions for buys, sells, and dividends
-    transactions = df[df["Trans Code"].isin(["Buy", "Sell", "CDIV"])].copy()
+    # Stream the statement through Arrow's CSV reader, keeping only buys,
+    # sells, and dividends so the full statement is never held in memory at
+    # once. Descriptions may span several lines, and malformed rows such as
+    # the trailing disclaimer are skipped.
+    with pa_csv.open_csv(
+        CSV_PATH,
+        parse_options=pa_csv.ParseOptions(
+            newlines_in_values=True, invalid_row_handler=lambda row: "skip"
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=CSV_COLUMNS,
+            column_types={column: pa.string() for column in CSV_COLUMNS},
+        ),
+    ) as reader:
+        trans_codes = pa.array(TRANS_CODES.categories)
+        transactions = pa.Table.from_batches(
+            (
+                batch.filter(pc.is_in(batch["Trans Code"], value_set=trans_codes))
+                for batch in reader
+            ),
+            schema=reader.schema,
+        ).to_pandas()
+    transactions = transactions.astype(
+        {"Instrument": "category", "Trans Code": TRANS_CODES}
+    )
 
     # Clean and convert relevant columns to numeric
-    transactions["Price"] = (
-        transactions["Price"].replace(r"[\$,]", "", regex=True).astype(float)
-    )
-    transactions["Amount"] = (
-        transactions["Amount"].replace(r"[\$,()]", "", regex=True).astype(float)
-    )
+    transactions["Price"] = _parse_currency(transactions["Price"])
+    transactions["Amount"] = _parse_currency(transactions["Amount"])
     transactions["Quantity"] = pd.to_numeric(transactions["Quantity"], errors="coerce")
 
-    # Separate the transactions
-    buy_transactions = transactions[transactions["Trans Code"] == "Buy"]
-    sell_transactions = transactions[transactions["Trans Code"] == "Sell"]
-    dividend_transactions = transactions[transactions["Trans Code"] == "CDIV"]
-
-    # Calculate total cost for each buy transaction
-    buy_transactions = buy_transactions.copy()  # Avoid SettingWithCopyWarning
-    buy_transactions["Total_Cost"] = (
-        buy_transactions["Price"] * buy_transactions["Quantity"]
+    # Split quantities, costs and dividends by transaction type so that a
+    # single groupby aggregates buys, sells and dividends without merges
+    trans_code = transactions["Trans Code"]
+    transactions["Quantity_buy"] = transactions["Quantity"].where(
+        trans_code == "Buy", 0
     )
-
-    # Aggregate buy, sell, and dividend data by instrument
-    buy_summary = (
-        buy_transactions.groupby("Instrument")
-        .agg({"Quantity": "sum", "Total_Cost": "sum"})
-        .reset_index()
-    )
-    sell_summary = (
-        sell_transactions.groupby("Instrument")["Quantity"].sum().reset_index()
+    transactions["Total_Cost"] = transactions["Price"] * transactions["Quantity_buy"]
+    transactions["Quantity_sell"] = transactions["Quantity"].where(
+        trans_code == "Sell", 0
     )
-    dividend_summary = (
-        dividend_transactions.groupby("Instrument")["Amount"].sum().reset_index()
+    transactions["Total_Dividends"] = transactions["Amount"].where(
+        trans_code == "CDIV", 0
     )
 
-    # Merge the buy and sell data
-    shares_summary = pd.merge(
-        buy_summary,
-        sell_summary,
-        on="Instrument",
-        how="left",
-        suffixes=("_buy", "_sell"),
+    # Aggregate buy, sell, and dividend data by instrument
+    shares_summary = (
+        transactions.groupby("Instrument", observed=True)[
+            ["Quantity_buy", "Total_Cost", "Quantity_sell", "Total_Dividends"]
+        ]
+        .sum()
+        .reset_index()
     )
-    shares_summary["Quantity_sell"] = shares_summary["Quantity_sell"].fillna(0)
 
     # Calculate net quantity
     shares_summary["Net_Quantity"] = (
@@ -85,371 +167,438 @@ def process_data():
     shares_summary["Total_Invested"] = shares_summary["Adjusted_Cost"].round(2)
 
     # Filter out instruments where no shares are currently held
-    final_shares = shares_summary[shares_summary["Net_Quantity"] > 0][
-        ["Instrument", "Net_Quantity", "Average_Price", "Total_Invested"]
-    ]
-
-    # Merge dividend data
-    final_summary = pd.merge(
-        final_shares, dividend_summary, on="Instrument", how="left"
-    )
-    final_summary["Total_Dividends"] = final_summary["Amount"].fillna(0)
-    final_summary.drop(columns="Amount", inplace=True)
+    final_summary = shares_summary[shares_summary["Net_Quantity"] > 0][
+        [
+            "Instrument",
+            "Net_Quantity",
+            "Average_Price",
+            "Total_Invested",
+            "Total_Dividends",
+        ]
+    ].reset_index(drop=True)
+    final_summary["Instrument"] = final_summary["Instrument"].astype(str)
 
     # Round the final values for clarity
     final_summary["Net_Quantity"] = final_summary["Net_Quantity"].round(3)
     final_summary["Total_Dividends"] = final_summary["Total_Dividends"].round(2)
     final_summary["Total_Invested"] = final_summary["Total_Invested"].round(2)
 
+    _save_cached_summary(final_summary, key)
     return final_summary
 
 
-# Load the data
-df = process_data()
-
-# Calculate additional metrics
-df["Dividend_Yield"] = (df["Total_Dividends"] / df["Total_Invested"]) * 100
-top_investments = df.sort_values(by="Total_Invested", ascending=False).head(5).round(3)
-top_dividend_yield = (
-    df.sort_values(by="Dividend_Yield", ascending=False).head(5).round(3)
-)
-
-# Summary statistics
-total_investment = df["Total_Invested"].sum()
-total_dividends = df["Total_Dividends"].sum()
-average_dividend_yield = df["Dividend_Yield"].mean()
-
-# Initialize the Dash app with a Bootstrap theme
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.SLATE])
-app.title = "Comprehensive Investment Dashboard"
-
-# Define the layout of the app
-app.layout = dbc.Container(
-    [
-        dbc.Row(
-            [
-                dbc.Col(
-                    html.H1(
-                        "Comprehensive Investment Dashboard",
-                        className="text-center my-4 text-light",
-                    ),
-                    width=12,
-                )
-            ]
-        ),
-        # Overview Cards
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        dbc.CardBody(
-                            [
-                                html.H4(
-                                    "Total Investment",
-                                    className="card-title text-light",
-                                ),
-                                html.H3(
-                                    f"${total_investment:,.2f}",
-                                    className="card-text text-success",
-                                ),
-                            ]
-                        ),
-                        className="mb-4",
-                        color="dark",
-                        inverse=True,
-                    ),
-                    width=4,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        dbc.CardBody(
-                            [
-                                html.H4(
-                                    "Total Dividends", className="card-title text-light"
-                                ),
-                                html.H3(
-                                    f"${total_dividends:,.2f}",
-                                    className="card-text text-info",
-                                ),
-                            ]
-                        ),
-                        className="mb-4",
-                        color="dark",
-                        inverse=True,
-                    ),
-                    width=4,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        dbc.CardBody(
-                            [
-                                html.H4(
-                                    "Average Dividend Yield",
-                                    className="card-title text-light",
-                                ),
-                                html.H3(
-                                    f"{average_dividend_yield:.2f}%",
-                                    className="card-text text-warning",
-                                ),
-                            ]
+def build_app(df):
+    # Build the dashboard for an already processed summary so that importing
+    # this module does not parse the statement or construct any figures
+
+    # Calculate additional metrics, leaving the yield at 0 when nothing is invested
+    invested = df["Total_Invested"].to_numpy()
+    df["Dividend_Yield"] = (
+        np.divide(
+            df["Total_Dividends"].to_numpy(),
+            invested,
+            out=np.zeros_like(invested),
+            where=invested > 0,
+        )
+        * 100
+    )
+    top_investments = df.nlargest(5, "Total_Invested").round(3)
+    top_dividend_yield = df.nlargest(5, "Dividend_Yield").round(3)
+
+    # Summary statistics
+    summary = df.agg(
+        {"Total_Invested": "sum", "Total_Dividends": "sum", "Dividend_Yield": "mean"}
+    )
+    total_investment = summary["Total_Invested"]
+    total_dividends = summary["Total_Dividends"]
+    average_dividend_yield = summary["Dividend_Yield"]
+
+    # Initialize the Dash app with a Bootstrap theme and gzip responses
+    app = StaticLayoutDash(
+        __name__, external_stylesheets=[dbc.themes.SLATE], compress=True
+    )
+    app.title = "Comprehensive Investment Dashboard"
+
+    # Define the layout of the app
+    app.layout = dbc.Container(
+        [
+            dbc.Row(
+                [
+                    dbc.Col(
+                        html.H1(
+                            "Comprehensive Investment Dashboard",
+                            className="text-center my-4 text-light",
                         ),
-                        className="mb-4",
-                        color="dark",
-                        inverse=True,
-                    ),
-                    width=4,
-                ),
-            ]
-        ),
-        # Tables and Charts
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
+                        width=12,
+                    )
+                ]
+            ),
+            # Overview Cards
+            dbc.Row(
+                [
+                    dbc.Col(
                         dbc.Card(
                             dbc.CardBody(
                                 [
                                     html.H4(
-                                        "Top Investments",
-                                        className="card-title text-center mb-4 text-light",
+                                        "Total Investment",
+                                        className="card-title text-light",
                                     ),
-                                    dash_table.DataTable(
-                                        id="top-investments-table",
-                                        columns=[
-                                            {"name": col, "id": col}
-                                            for col in top_investments.columns
-                                        ],
-                                        data=top_investments.to_dict("records"),
-                                        page_size=5,
-                                        style_table={
-                                            "height": "300px",
-                                            "overflowY": "auto",
-                                            "width": "100%",
-                                            "border": "1px solid #444",
-                                            "boxShadow": "0px 4px 12px rgba(0, 0, 0, 0.3)",
-                                            "borderRadius": "10px",
-                                        },
-                                        style_header={
-                                            "backgroundColor": "#1b1b1b",
-                                            "fontWeight": "bold",
-                                            "color": "#e2e2e2",
-                                            "borderBottom": "1px solid #444",
-                                        },
-                                        style_cell={
-                                            "textAlign": "left",
-                                            "padding": "10px",
-                                            "fontSize": "14px",
-                                            "border": "1px solid #444",
-                                            "backgroundColor": "#2a2a2a",
-                                            "color": "#e2e2e2",
-                                        },
+                                    html.H3(
+                                        f"${total_investment:,.2f}",
+                                        className="card-text text-success",
                                     ),
                                 ]
                             ),
-                            style={
-                                "height": "100%",
-                                "backgroundColor": "#222",
-                                "borderRadius": "12px",
-                            },
-                        )
-                    ],
-                    width=6,
-                    className="mb-4",
-                ),
-                dbc.Col(
-                    [
+                            className="mb-4",
+                            color="dark",
+                            inverse=True,
+                        ),
+                        width=4,
+                    ),
+                    dbc.Col(
                         dbc.Card(
                             dbc.CardBody(
                                 [
                                     html.H4(
-                                        "Top Dividend Yield Instruments",
-                                        className="card-title text-center mb-4 text-light",
+                                        "Total Dividends",
+                                        className="card-title text-light",
                                     ),
-                                    dash_table.DataTable(
-                                        id="top-dividend-yield-table",
-                                        columns=[
-                                            {"name": col, "id": col}
-                                            for col in top_dividend_yield.columns
-                                        ],
-                                        data=top_dividend_yield.to_dict("records"),
-                                        page_size=5,
-                                        style_table={
-                                            "height": "300px",
-                                            "overflowY": "auto",
-                                            "width": "100%",
-                                            "border": "1px solid #444",
-                                            "boxShadow": "0px 4px 12px rgba(0, 0, 0, 0.3)",
-                                            "borderRadius": "10px",
-                                        },
-                                        style_header={
-                                            "backgroundColor": "#1b1b1b",
-                                            "fontWeight": "bold",
-                                            "color": "#e2e2e2",
-                                            "borderBottom": "1px solid #444",
-                                        },
-                                        style_cell={
-                                            "textAlign": "left",
-                                            "padding": "10px",
-                                            "fontSize": "14px",
-                                            "border": "1px solid #444",
-                                            "backgroundColor": "#2a2a2a",
-                                            "color": "#e2e2e2",
-                                        },
+                                    html.H3(
+                                        f"${total_dividends:,.2f}",
+                                        className="card-text text-info",
                                     ),
                                 ]
                             ),
-                            style={
-                                "height": "100%",
-                                "backgroundColor": "#222",
-                                "borderRadius": "12px",
-                            },
-                        )
-                    ],
-                    width=6,
-                    className="mb-4",
-                ),
-            ]
-        ),
-        # Charts
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
+                            className="mb-4",
+                            color="dark",
+                            inverse=True,
+                        ),
+                        width=4,
+                    ),
+                    dbc.Col(
                         dbc.Card(
                             dbc.CardBody(
                                 [
                                     html.H4(
-                                        "Investment Distribution",
-                                        className="card-title text-center mb-4 text-light",
+                                        "Average Dividend Yield",
+                                        className="card-title text-light",
                                     ),
-                                    dcc.Graph(
-                                        id="pie-chart",
-                                        figure=px.pie(
-                                            df,
-                                            names="Instrument",
-                                            values="Total_Invested",
-                                            title="Portfolio Distribution",
-                                            hole=0.4,
-                                            template="plotly_dark",
-                                            color_discrete_sequence=px.colors.sequential.Plasma,
-                                        ).update_layout(
-                                            showlegend=True,
-                                            title_x=0.5,
-                                            margin=dict(l=20, r=20, t=40, b=20),
-                                            transition={
-                                                "duration": 800,
-                                                "easing": "cubic-in-out",
-                                            },
-                                        ),
+                                    html.H3(
+                                        f"{average_dividend_yield:.2f}%",
+                                        className="card-text text-warning",
                                     ),
                                 ]
                             ),
-                            style={"backgroundColor": "#222", "borderRadius": "12px"},
-                        )
-                    ],
-                    width=6,
-                    className="mb-4",
-                ),
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            dbc.CardBody(
-                                [
-                                    html.H4(
-                                        "Top Investments (Bar Chart)",
-                                        className="card-title text-center mb-4 text-light",
-                                    ),
-                                    dcc.Graph(
-                                        id="bar-chart",
-                                        figure=px.bar(
-                                            top_investments,
-                                            x="Instrument",
-                                            y="Total_Invested",
-                                            title="Top Investments by Total Invested Amount",
-                                            labels={
-                                                "Total_Invested": "Total Invested ($)",
-                                                "Instrument": "Stock",
+                            className="mb-4",
+                            color="dark",
+                            inverse=True,
+                        ),
+                        width=4,
+                    ),
+                ]
+            ),
+            # Tables and Charts
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                dbc.CardBody(
+                                    [
+                                        html.H4(
+                                            "Top Investments",
+                                            className="card-title text-center mb-4 text-light",
+                                        ),
+                                        dash_table.DataTable(
+                                            id="top-investments-table",
+                                            columns=[
+                                                {"name": col, "id": col}
+                                                for col in top_investments.columns
+                                            ],
+                                            data=top_investments.to_dict("records"),
+                                            page_size=5,
+                                            style_table={
+                                                "height": "300px",
+                                                "overflowY": "auto",
+                                                "width": "100%",
+                                                "border": "1px solid #444",
+                                                "boxShadow": "0px 4px 12px rgba(0, 0, 0, 0.3)",
+                                                "borderRadius": "10px",
                                             },
-                                            template="plotly_dark",
-                                        ).update_layout(
-                                            margin=dict(l=20, r=20, t=40, b=20),
-                                            transition={
-                                                "duration": 800,
-                                                "easing": "cubic-in-out",
+                                            style_header={
+                                                "backgroundColor": "#1b1b1b",
+                                                "fontWeight": "bold",
+                                                "color": "#e2e2e2",
+                                                "borderBottom": "1px solid #444",
+                                            },
+                                            style_cell={
+                                                "textAlign": "left",
+                                                "padding": "10px",
+                                                "fontSize": "14px",
+                                                "border": "1px solid #444",
+                                                "backgroundColor": "#2a2a2a",
+                                                "color": "#e2e2e2",
                                             },
                                         ),
-                                    ),
-                                ]
-                            ),
-                            style={"backgroundColor": "#222", "borderRadius": "12px"},
-                        )
-                    ],
-                    width=6,
-                    className="mb-4",
-                ),
-            ]
-        ),
-        # Final Summary Table
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            dbc.CardBody(
-                                [
-                                    html.H4(
-                                        "Final Investment Summary",
-                                        className="card-title text-center mb-4 text-light",
-                                    ),
-                                    dash_table.DataTable(
-                                        id="final-summary-table",
-                                        columns=[
-                                            {"name": col, "id": col}
-                                            for col in df.columns
-                                        ],
-                                        data=df.to_dict("records"),
-                                        page_size=10,
-                                        style_table={
-                                            "height": "400px",
-                                            "overflowY": "auto",
-                                            "width": "100%",
-                                            "border": "1px solid #444",
-                                            "boxShadow": "0px 4px 12px rgba(0, 0, 0, 0.3)",
-                                            "borderRadius": "10px",
-                                        },
-                                        style_header={
-                                            "backgroundColor": "#1b1b1b",
-                                            "fontWeight": "bold",
-                                            "color": "#e2e2e2",
-                                            "borderBottom": "1px solid #444",
-                                        },
-                                        style_cell={
-                                            "textAlign": "left",
-                                            "padding": "10px",
-                                            "fontSize": "14px",
-                                            "border": "1px solid #444",
-                                            "backgroundColor": "#2a2a2a",
-                                            "color": "#e2e2e2",
-                                        },
-                                    ),
-                                ]
-                            ),
-                            style={
-                                "backgroundColor": "#222",
-                                "borderRadius": "12px",
-                            },
-                        )
-                    ],
-                    width=12,
-                    className="mb-4",
-                ),
-            ]
-        ),
-    ],
-    fluid=True,
-    style={"backgroundColor": "#1a1a1a", "padding": "20px"},
-)
+                                    ]
+                                ),
+                                style={
+                                    "height": "100%",
+                                    "backgroundColor": "#222",
+                                    "borderRadius": "12px",
+                                },
+                            )
+                        ],
+                        width=6,
+                        className="mb-4",
+                    ),
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                dbc.CardBody(
+                                    [
+                                        html.H4(
+                                            "Top Dividend Yield Instruments",
+                                            className="card-title text-center mb-4 text-light",
+                                        ),
+                                        dash_table.DataTable(
+                                            id="top-dividend-yield-table",
+                                            columns=[
+                                                {"name": col, "id": col}
+                                                for col in top_dividend_yield.columns
+                                            ],
+                                            data=top_dividend_yield.to_dict("records"),
+                                            page_size=5,
+                                            style_table={
+                                                "height": "300px",
+                                                "overflowY": "auto",
+                                                "width": "100%",
+                                                "border": "1px solid #444",
+                                                "boxShadow": "0px 4px 12px rgba(0, 0, 0, 0.3)",
+                                                "borderRadius": "10px",
+                                            },
+                                            style_header={
+                                                "backgroundColor": "#1b1b1b",
+                                                "fontWeight": "bold",
+                                                "color": "#e2e2e2",
+                                                "borderBottom": "1px solid #444",
+                                            },
+                                            style_cell={
+                                                "textAlign": "left",
+                                                "padding": "10px",
+                                                "fontSize": "14px",
+                                                "border": "1px solid #444",
+                                                "backgroundColor": "#2a2a2a",
+                                                "color": "#e2e2e2",
+                                            },
+                                        ),
+                                    ]
+                                ),
+                                style={
+                                    "height": "100%",
+                                    "backgroundColor": "#222",
+                                    "borderRadius": "12px",
+                                },
+                            )
+                        ],
+                        width=6,
+                        className="mb-4",
+                    ),
+                ]
+            ),
+            # Charts
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                dbc.CardBody(
+                                    [
+                                        html.H4(
+                                            "Investment Distribution",
+                                            className="card-title text-center mb-4 text-light",
+                                        ),
+                                        dcc.Graph(
+                                            id="pie-chart",
+                                            figure=px.pie(
+                                                df,
+                                                names="Instrument",
+                                                values="Total_Invested",
+                                                title="Portfolio Distribution",
+                                                hole=0.4,
+                                                template="plotly_dark",
+                                                color_discrete_sequence=px.colors.sequential.Plasma,
+                                            ).update_layout(
+                                                showlegend=True,
+                                                title_x=0.5,
+                                                margin=dict(l=20, r=20, t=40, b=20),
+                                                transition={
+                                                    "duration": 800,
+                                                    "easing": "cubic-in-out",
+                                                },
+                                            ),
+                                        ),
+                                    ]
+                                ),
+                                style={
+                                    "backgroundColor": "#222",
+                                    "borderRadius": "12px",
+                                },
+                            )
+                        ],
+                        width=6,
+                        className="mb-4",
+                    ),
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                dbc.CardBody(
+                                    [
+                                        html.H4(
+                                            "Top Investments (Bar Chart)",
+                                            className="card-title text-center mb-4 text-light",
+                                        ),
+                                        dcc.Dropdown(
+                                            id="bar-chart-instruments",
+                                            options=df["Instrument"].tolist(),
+                                            value=top_investments[
+                                                "Instrument"
+                                            ].tolist(),
+                                            multi=True,
+                                            className="mb-3",
+                                            style={"color": "#1b1b1b"},
+                                        ),
+                                        dcc.Store(
+                                            id="bar-chart-store",
+                                            data=df[
+                                                ["Instrument", "Total_Invested"]
+                                            ].to_dict("records"),
+                                        ),
+                                        dcc.Graph(
+                                            id="bar-chart",
+                                            figure=px.bar(
+                                                top_investments,
+                                                x="Instrument",
+                                                y="Total_Invested",
+                                                title="Top Investments by Total Invested Amount",
+                                                labels={
+                                                    "Total_Invested": "Total Invested ($)",
+                                                    "Instrument": "Stock",
+                                                },
+                                                template="plotly_dark",
+                                            ).update_layout(
+                                                margin=dict(l=20, r=20, t=40, b=20),
+                                                transition={
+                                                    "duration": 800,
+                                                    "easing": "cubic-in-out",
+                                                },
+                                            ),
+                                        ),
+                                    ]
+                                ),
+                                style={
+                                    "backgroundColor": "#222",
+                                    "borderRadius": "12px",
+                                },
+                            )
+                        ],
+                        width=6,
+                        className="mb-4",
+                    ),
+                ]
+            ),
+            # Final Summary Table
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                dbc.CardBody(
+                                    [
+                                        html.H4(
+                                            "Final Investment Summary",
+                                            className="card-title text-center mb-4 text-light",
+                                        ),
+                                        dash_table.DataTable(
+                                            id="final-summary-table",
+                                            columns=[
+                                                {"name": col, "id": col}
+                                                for col in df.columns
+                                            ],
+                                            data=df.to_dict("records"),
+                                            page_size=10,
+                                            style_table={
+                                                "height": "400px",
+                                                "overflowY": "auto",
+                                                "width": "100%",
+                                                "border": "1px solid #444",
+                                                "boxShadow": "0px 4px 12px rgba(0, 0, 0, 0.3)",
+                                                "borderRadius": "10px",
+                                            },
+                                            style_header={
+                                                "backgroundColor": "#1b1b1b",
+                                                "fontWeight": "bold",
+                                                "color": "#e2e2e2",
+                                                "borderBottom": "1px solid #444",
+                                            },
+                                            style_cell={
+                                                "textAlign": "left",
+                                                "padding": "10px",
+                                                "fontSize": "14px",
+                                                "border": "1px solid #444",
+                                                "backgroundColor": "#2a2a2a",
+                                                "color": "#e2e2e2",
+                                            },
+                                        ),
+                                    ]
+                                ),
+                                style={
+                                    "backgroundColor": "#222",
+                                    "borderRadius": "12px",
+                                },
+                            )
+                        ],
+                        width=12,
+                        className="mb-4",
+                    ),
+                ]
+            ),
+        ],
+        fluid=True,
+        style={"backgroundColor": "#1a1a1a", "padding": "20px"},
+    )
+
+    # Rebuild the bar chart in the browser from the stored summary so picking
+    # instruments does not need a round-trip to the server
+    app.clientside_callback(
+        """
+        function(selected, records, figure) {
+            const rows = records
+                .filter((row) => (selected || []).includes(row.Instrument))
+                .sort((a, b) => b.Total_Invested - a.Total_Invested);
+            const trace = Object.assign({}, figure.data[0], {
+                x: rows.map((row) => row.Instrument),
+                y: rows.map((row) => row.Total_Invested),
+            });
+            return Object.assign({}, figure, {data: [trace]});
+        }
+        """,
+        Output("bar-chart", "figure"),
+        Input("bar-chart-instruments", "value"),
+        State("bar-chart-store", "data"),
+        State("bar-chart", "figure"),
+        prevent_initial_call=True,
+    )
+
+    return app
+
+
+def create_server():
+    # WSGI factory that processes the statement and returns the Flask server
+    return build_app(process_data()).server
+
 
 # Run the app
 if __name__ == "__main__":
-    app.run_server(host='0.0.0.0', port=8050, debug=True)
+    serve(create_server(), host="0.0.0.0", port=8050)